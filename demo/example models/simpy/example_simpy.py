@@ -1,22 +1,65 @@
 import simpy
-import csv
 import argparse
+import heapq
+import os
+from contextlib import contextmanager
+from collections import deque
+
+# size of the output file buffer; events are written as they occur and flushed in large blocks
+WRITE_BUFFER_SIZE = 1 << 20
+
+# number of log lines collected before they are handed to the file in one write call
+LOG_CHUNK_SIZE = 4096
+
+# opens the output CSV as a temporary file next to the target, which only replaces the target once
+# the run has finished; a failed run leaves no header-only or partial result behind
+@contextmanager
+def open_output(output_file):
+    part_file = f"{output_file}.part"
+    try:
+        with open(part_file, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(b"Entity,Event,Time\r\n")
+            yield f
+    except BaseException:
+        os.remove(part_file)
+        raise
+    os.replace(part_file, output_file)
+
+# collects preformatted log lines and writes them to the output file in chunks
+class ChunkedLog:
+    def __init__(self, f, chunk_size=LOG_CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.lines = []
+
+    def write(self, line):
+        self.lines.append(line)
+        if len(self.lines) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        self.f.write(b"".join(self.lines))
+        self.lines.clear()
 
 # customer process representing an individual entity that uses the shared resource
-def customer(env, name, resource, service_time, log):
+# log rows have a fixed schema without separators or quotes, so they are formatted
+# directly as bytes (same layout as csv.writer: repr of the time, CRLF line ending)
+def customer(env, name, resource, service_time, out):
+    name = name.encode()
+
     # time of arrival in the simulation → log the arrival event
     arrival_time = env.now  
-    log.append([name, 'arrived', arrival_time])
+    out.write(b"%s,arrived,%r\r\n" % (name, arrival_time))
 
     # request access to the shared resource
     with resource.request() as req:  
         # wait until the resource is available → log when resource is obtained
         yield req  
-        log.append([name, 'got resource', env.now]) 
+        out.write(b"%s,got resource,%r\r\n" % (name, env.now)) 
 
         # hold the resource for the given service time → log the time when service is done
         yield env.timeout(service_time) 
-        log.append([name, 'finished', env.now]) 
+        out.write(b"%s,finished,%r\r\n" % (name, env.now)) 
 
 # sets up and runs the discrete-event simulation
 def run_simulation(num_customers, interarrival_time, service_time, resource_capacity, simulation_duration, output_file):
@@ -26,23 +69,64 @@ def run_simulation(num_customers, interarrival_time, service_time, resource_capa
     # create a resource with defined capacity
     resource = simpy.Resource(env, capacity=resource_capacity)
 
-    # create a list to collect simulation events
-    log = [] 
+    # stream simulation events to the CSV file through a large write buffer
+    with open_output(output_file) as f:
+        log = ChunkedLog(f)
+
+        try:
+            # schedule customer arrivals at regular interarrival_time intervals
+            for i in range(num_customers):
+                # start a customer process and wait before the next customer arrives
+                env.process(customer(env, f'Customer{i+1}', resource, service_time, log))
+                yield env.timeout(interarrival_time)
+
+            # run the simulation until the specified duration
+            env.run(until=simulation_duration)
+        finally:
+            # write the residue of the last incomplete chunk
+            log.flush()
+
+# computes the same event log as run_simulation without the SimPy event scheduler
+def run_simulation_fast(num_customers, interarrival_time, service_time, resource_capacity, simulation_duration, output_file):
+    # zero-length (or invalid negative) services interleave releases and grants at the same time
+    # in SimPy's event order, so those runs are left to the SimPy engine itself
+    if service_time <= 0:
+        deque(run_simulation(num_customers, interarrival_time, service_time, resource_capacity, simulation_duration, output_file), maxlen=0)
+        return
 
-    # schedule customer arrivals at regular interarrival_time intervals
+    # validate the inputs at the same points (and with the same errors) as SimPy
+    if resource_capacity <= 0:
+        raise ValueError('"capacity" must be > 0.')
+
+    # all customer processes are registered before env.run() starts, so every customer
+    # arrives at t=0 and the resource is granted in FIFO order to the earliest free slot
+    free_at = [0] * resource_capacity
+    events = []
     for i in range(num_customers):
-        # start a customer process and wait before the next customer arrives
-        env.process(customer(env, f'Customer{i+1}', resource, service_time, log))
-        yield env.timeout(interarrival_time)
+        start = heapq.heappop(free_at)
+        end = start + service_time
+        heapq.heappush(free_at, end)
 
-    # run the simulation until the specified duration
-    env.run(until=simulation_duration)
+        # sort key (time, phase, customer): at equal times SimPy logs arrivals first,
+        # then finished services, then the resources granted by those releases
+        events.append((0, 0, i, b'arrived'))
+        events.append((start, 2, i, b'got resource'))
+        events.append((end, 1, i, b'finished'))
+    events.sort(key=lambda e: e[:3])
 
-    # write the simulation log to a CSV file
-    with open(output_file, 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow(['Entity', 'Event', 'Time'])
-        writer.writerows(log)
+    # events at or after the simulation duration are not processed by env.run(until=...)
+    with open_output(output_file) as f:
+        # SimPy rejects a negative interarrival time and the duration only once the run has started
+        if num_customers > 0 and interarrival_time < 0:
+            raise ValueError(f"Negative delay {interarrival_time}")
+        if simulation_duration <= 0:
+            raise ValueError(f"until ({simulation_duration}) must be greater than the current simulation time")
+        log = ChunkedLog(f)
+        for time, _, i, event in events:
+            if time >= simulation_duration:
+                break
+            log.write(b"Customer%d,%s,%r\r\n" % (i + 1, event, time))
+        log.flush()
 
 # parses command-line arguments and launches the simulation
 def main():
@@ -56,11 +140,25 @@ def main():
     parser.add_argument('--capacity', type=int, default=1, help='Capacity of the shared resource')
     parser.add_argument('--duration', type=float, default=30.0, help='Total simulation time')
     parser.add_argument('--output', type=str, default='simpy_output.csv', help='Name of the output CSV file')
+    # engine switch for benchmarking; hidden from --help so it is not picked up as a model factor
+    # (fast computes the queue directly without the SimPy scheduler)
+    parser.add_argument('--engine', type=str, default='simpy', choices=['simpy', 'fast'], help=argparse.SUPPRESS)
 
     args = parser.parse_args()
 
+    if args.engine == 'fast':
+        run_simulation_fast(
+            num_customers=args.customers,
+            interarrival_time=args.interarrival,
+            service_time=args.service_time,
+            resource_capacity=args.capacity,
+            simulation_duration=args.duration,
+            output_file=args.output
+        )
+        return
+
     # run_simulation is a generator because it yields on interarrival delay;
-    # this loop steps through the generator manually to execute it
+    # a zero-length deque exhausts it without stepping through it in Python
     sim = run_simulation(
         num_customers=args.customers,
         interarrival_time=args.interarrival,
@@ -69,12 +167,7 @@ def main():
         simulation_duration=args.duration,
         output_file=args.output
     )
-    try:
-        next(sim)
-        while True:
-            next(sim)
-    except StopIteration:
-        pass
+    deque(sim, maxlen=0)
 
 # entry point for command-line execution
 if __name__ == "__main__":
@@ -46,8 +46,9 @@ class AnyLogicModelExecutor:
         if not os.path.exists(model_path):
             raise FileNotFoundError(f"Model path not found: {model_path}")
 
+        # a missing folder is reported by run_anylogic when it scans for the run script
         resource_folder = exec_context.flow_variables.get("resource_folder")
-        if not resource_folder or not os.path.exists(resource_folder):
+        if not resource_folder:
             raise FileNotFoundError(f"Resource folder not found: {resource_folder}")
 
         try:
@@ -4,12 +4,130 @@ from utils import parameter_utils as parameters
 from sim_ext import main_category
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import time
 from math import prod
+from functools import lru_cache
 
 # setup logger
 LOGGER = logging.getLogger(__name__)
 
+# extracts the unique non-missing values of an arrow column in order of first appearance
+# (nulls and float NaNs are both treated as missing, like pandas dropna)
+def _unique_levels(column: pa.ChunkedArray) -> list:
+    column = pc.drop_null(column)
+    if pa.types.is_floating(column.type):
+        column = column.filter(pc.invert(pc.is_nan(column)))
+    return pc.unique(column).to_pylist()
+
+# full factorial index matrices can reach millions of rows, so they are rebuilt per execution
+def _fullfact_indices(level_counts: tuple) -> np.ndarray:
+    # coded indices 0..L-1 per factor in pyDOE3.fullfact order (first factor varies fastest);
+    # the transposed view keeps each factor's index column contiguous for the gather
+    k = len(level_counts)
+    return np.indices(level_counts[::-1]).reshape(k, -1)[::-1].T
+
+# the plackett-burman matrix only depends on the number of factors and stays small, so it is cached
+# across executions (the cached array is shared and therefore read-only)
+@lru_cache(maxsize=32)
+def _pb_matrix(n_factors: int) -> np.ndarray:
+    from pyDOE3 import pbdesign as py_pb
+
+    # build pb coded matrix (-1/+1)
+    M = np.array(py_pb(n_factors))
+    M.setflags(write=False)
+    return M
+
+# full factorial: every combination of factor levels
+def _build_full_factorial(node, factor_cols, levels_map, is_numeric_map) -> dict:
+    # check for combinatorial explosion
+    level_counts = [max(1, len(levels_map[c])) for c in factor_cols]
+    est_runs = int(prod(level_counts)) if level_counts else 0
+    if est_runs > 1_000_000:
+        raise ValueError(
+            f"Full factorial would generate {est_runs:,} rows (> 1,000,000). "
+            f"Please reduce factor levels."
+        )
+
+    raw = _fullfact_indices(tuple(level_counts))
+
+    # map indices to actual values via a numpy gather per factor
+    data = {}
+    for j, col in enumerate(factor_cols):
+        lvls = levels_map[col]
+        if not lvls:
+            raise ValueError(f"Factor '{col}' has no defined levels.")
+        data[col] = pd.Series(lvls).to_numpy()[raw[:, j]]
+    return data
+
+# latin hypercube; space-filling via criterion='maximin'
+def _build_latin_hypercube(node, factor_cols, levels_map, is_numeric_map) -> dict:
+    from pyDOE3 import lhs as py_lhs
+    from scipy.stats import qmc
+
+    num_samples = int(node.samples)
+    if num_samples < 1:
+        raise ValueError("Samples must be >= 1.")
+
+    n_factors = len(factor_cols)
+    criterion = "maximin" if node.design_choice == parameters.ExperimentDesigns.SPACEFILLINGLHS.name else None
+    iterations = int(getattr(node, "lhs_iterations", 10)) if criterion == "maximin" else 1
+
+    # both samplers return values in [0,1]; plain LHS uses scipy's vectorized sampler,
+    # the maximin optimization is only available in pyDOE3
+    if criterion is None:
+        U = qmc.LatinHypercube(d=n_factors).random(n=num_samples)
+    else:
+        U = py_lhs(n_factors, samples=num_samples, criterion=criterion, iterations=iterations)
+
+    # discretize to nearest level (input values are discrete like 1/2/3)
+    for col in factor_cols:
+        if not levels_map[col]:
+            raise ValueError(f"Factor '{col}' has no defined levels.")
+    # U >= 0, so truncation equals floor; the upper bound catches U == 1
+    L_vec = np.fromiter((len(levels_map[c]) for c in factor_cols), dtype=np.int64, count=n_factors)
+    idx_mat = np.minimum((U * L_vec).astype(np.int64), L_vec - 1)
+    return {
+        col: pd.Series(levels_map[col]).to_numpy()[idx_mat[:, j]]
+        for j, col in enumerate(factor_cols)
+    }
+
+# plackett-burman screening design on exactly two levels per factor
+def _build_plackett_burman(node, factor_cols, levels_map, is_numeric_map) -> dict:
+    # require exactly two distinct levels per factor
+    for col, lvls in levels_map.items():
+        if len(lvls) != 2 or len(set(lvls)) != 2:
+            raise ValueError(
+                f"Plackett–Burman requires exactly 2 distinct levels per factor. "
+                f"Factor '{col}' has {len(set(lvls))} distinct level(s)."
+            )
+
+    n_factors = len(factor_cols)
+    M = _pb_matrix(n_factors)
+
+    # for numeric factors: low/high = min/max; for non-numeric: use input order (first = low, second = high)
+    lo_hi = np.empty((n_factors, 2), dtype=object)
+    for j, col in enumerate(factor_cols):
+        lvls = levels_map[col]
+        if is_numeric_map[col]:
+            lo_hi[j] = (min(lvls), max(lvls))
+        else:
+            lo_hi[j] = (lvls[0], lvls[1])
+
+    # map coded levels to actual values in a single gather (-1 → low, +1 → high)
+    # gathered columns are object arrays, restore the natural dtype of each factor
+    mat = lo_hi[np.arange(n_factors), (M > 0).astype(np.intp)]
+    return dict(pd.DataFrame(mat, columns=factor_cols, copy=False).infer_objects().items())
+
+# maps each selectable design to the function generating its factor columns
+DESIGN_BUILDERS = {
+    parameters.ExperimentDesigns.FULLFAC.name: _build_full_factorial,
+    parameters.ExperimentDesigns.LHS.name: _build_latin_hypercube,
+    parameters.ExperimentDesigns.SPACEFILLINGLHS.name: _build_latin_hypercube,
+    parameters.ExperimentDesigns.PLACKETTBURMAN.name: _build_plackett_burman,
+}
+
 # define the KNIME node
 @knext.node(
     name="Design of Experiments",
@@ -91,191 +209,107 @@ This node combines one or more factor definition tables produced by the Factor D
 
     # main execution logic
     def execute(self, exec_context, input_tables: list[knext.Table]):
-        from pyDOE3 import lhs as py_lhs, fullfact as py_fullfact, pbdesign as py_pb
         from utils import factor_utils
 
-        # collect inputs into one dictionary (column -> list)
-        merged_dict: dict = {}
-        seen = set()
+        # collect inputs into one dictionary (column -> arrow column), later tables overwrite duplicates
+        # the KNIME arrow buffers are used directly, no pandas frame is materialized
+        merged_columns: dict[str, pa.ChunkedArray] = {}
         for input_table in input_tables:
+            # unconnected optional ports are None, conversion errors are not swallowed
             if input_table is None:
                 continue
-            try:
-                df_in = input_table.to_pandas()
-                cols = df_in.columns.tolist()
-                dups = [c for c in cols if c in seen]
-                if dups:
-                    LOGGER.warning(f"duplicate factor columns overwritten: {dups}")
-                seen.update(cols)
-                merged_dict |= df_in.to_dict(orient="list")
-            except Exception as e:
-                LOGGER.warning(f"error processing an input table: {e}")
-
-        if not merged_dict:
+            pa_in = input_table.to_pyarrow()
+            cols = [n for n in pa_in.column_names if n != "<RowID>"]
+            dups = [c for c in cols if c in merged_columns]
+            if dups:
+                LOGGER.warning(f"duplicate factor columns overwritten: {dups}")
+            for c in cols:
+                merged_columns[c] = pa_in.column(c)
+
+        if not merged_columns:
             raise ValueError("No input data provided.")
 
         # keep stable factor order
-        factor_cols: list[str] = list(merged_dict.keys())
-
-        # helper: extract unique non-NaN levels preserving order
-        def unique_levels(col_values):
-            vals = [v for v in col_values if pd.notna(v)]
-            seen_vals, out = set(), []
-            for v in vals:
-                if v not in seen_vals:
-                    seen_vals.add(v)
-                    out.append(v)
-            return out
-
-        # get levels and counts
-        levels_map: dict[str, list] = {c: unique_levels(merged_dict[c]) for c in factor_cols}
-        level_counts: list[int] = [max(1, len(levels_map[c])) for c in factor_cols]
-
-        # generate design based on selected method
-        design_choice = self.design_choice
-        n_factors = len(factor_cols)
-
-        if design_choice == parameters.ExperimentDesigns.FULLFAC.name:
-            # check for combinatorial explosion
-            est_runs = int(prod(level_counts)) if level_counts else 0
-            if est_runs > 1_000_000:
-                raise ValueError(
-                    f"Full factorial would generate {est_runs:,} rows (> 1,000,000). "
-                    f"Please reduce factor levels."
-                )
-
-            # pyDOE3.fullfact returns coded indices 0..L-1
-            raw = np.array(py_fullfact(level_counts), dtype=int)
-
-            # map indices to actual values
-            data = {}
-            for j, col in enumerate(factor_cols):
-                lvls = levels_map[col]
-                if not lvls:
-                    raise ValueError(f"Factor '{col}' has no defined levels.")
-                data[col] = [lvls[idx] for idx in raw[:, j]]
-            df_doe = pd.DataFrame(data)
-
-        elif design_choice in (
-            parameters.ExperimentDesigns.LHS.name,
-            parameters.ExperimentDesigns.SPACEFILLINGLHS.name,
-        ):
-            # latin hypercube; space-filling via criterion='maximin'
-            num_samples = int(self.samples)
-            if num_samples < 1:
-                raise ValueError("Samples must be >= 1.")
-
-            criterion = "maximin" if design_choice == parameters.ExperimentDesigns.SPACEFILLINGLHS.name else None
-            iterations = int(getattr(self, "lhs_iterations", 10)) if criterion == "maximin" else 1
-
-            # pyDOE3.lhs returns values in [0,1]
-            U = py_lhs(n_factors, samples=num_samples, criterion=criterion, iterations=iterations)
-
-            # discretize to nearest level (input values are discrete like 1/2/3)
-            data = {}
-            for j, col in enumerate(factor_cols):
-                lvls = levels_map[col]
-                if not lvls:
-                    raise ValueError(f"Factor '{col}' has no defined levels.")
-                L = len(lvls)
-                idx = np.floor(U[:, j] * L).astype(int)
-                idx = np.clip(idx, 0, L - 1)
-                data[col] = [lvls[i] for i in idx]
-            df_doe = pd.DataFrame(data)
-
-        elif design_choice == parameters.ExperimentDesigns.PLACKETTBURMAN.name:
-            # require exactly two distinct levels per factor
-            for col, lvls in levels_map.items():
-                if len(lvls) != 2 or len(set(lvls)) != 2:
-                    raise ValueError(
-                        f"Plackett–Burman requires exactly 2 distinct levels per factor. "
-                        f"Factor '{col}' has {len(set(lvls))} distinct level(s)."
-                    )
-
-            # build pb coded matrix (-1/+1)
-            M = np.array(py_pb(n_factors))
-
-            # for numeric factors: low/high = min/max; for non-numeric: use input order (first = low, second = high)
-            data = {}
-            for j, col in enumerate(factor_cols):
-                lvls = levels_map[col]
-                s = pd.Series(lvls)
-                if pd.api.types.is_numeric_dtype(s):
-                    low, high = (min(lvls), max(lvls))
-                else:
-                    low, high = lvls[0], lvls[1]
-
-                # map coded levels to actual values
-                mapped = np.where(M[:, j] <= 0, low, high)
-                data[col] = mapped.tolist()
-
-            df_doe = pd.DataFrame(data)
+        factor_cols: list[str] = list(merged_columns.keys())
 
-        else:
+        # get unique non-missing levels (first-seen order)
+        levels_map: dict[str, list] = {c: _unique_levels(merged_columns[c]) for c in factor_cols}
+
+        # classify levels as numeric once (same outcome as is_numeric_dtype on a series of the levels)
+        numeric_kinds = ("integer", "floating", "mixed-integer-float", "boolean")
+        is_numeric_map: dict[str, bool] = {
+            c: pd.api.types.infer_dtype(levels_map[c], skipna=True) in numeric_kinds for c in factor_cols
+        }
+
+        # generate design based on selected method (dispatch table instead of an if/elif chain)
+        design_choice = self.design_choice
+        build_design = DESIGN_BUILDERS.get(design_choice)
+        if build_design is None:
             # other designs are not supported in pyDOE3
             raise ValueError(f"Design {design_choice} is not implemented in pyDOE3.")
+        data = build_design(self, factor_cols, levels_map, is_numeric_map)
 
-        # add experiment metadata columns
+        # build the wide table in one go with the experiment metadata columns in front
         experiment_name = f"{time.strftime('%Y-%m-%d_%H%M%S')}_{design_choice}"
-        df_doe.insert(0, "EXPERIMENT", experiment_name)
-        df_doe.insert(1, "CONFIGURATION", [f"configuration_{i:06d}" for i in range(len(df_doe))])
-
-        # transform wide format into long format
-        rows = []
-        for _, row in df_doe.iterrows():
-            configuration = row["CONFIGURATION"]
-            for col in df_doe.columns:
-                if col in ("EXPERIMENT", "CONFIGURATION"):
-                    continue
-                try:
-                    # parse metadata from column name
-                    parts = col.split(":")
-                    is_argument_based = len(parts) == 1
-                    if is_argument_based:
-                        table = "ARGUMENT"
-                        #unique_col = unique_id = name_col = value_col = factor_name = col
-                        unique_col = unique_id = value_col = col
-                    else:
-                        table = parts[0] if parts else "?"
-                        label_map = {}
-                        value_col = "?"
-                        for part in parts[1:]:
-                            if part.startswith("[") and "]" in part:
-                                label = part[1:part.find("]")]
-                                value = part[part.find("]") + 1:]
-                                label_map[label.upper()] = value
-                            else:
-                                value_col = part
-                        labels_sorted = sorted(label_map.items())
-                        unique_col, unique_id = labels_sorted[0] if labels_sorted else ("?", "?")
-                        #name_col, factor_name = labels_sorted[1] if len(labels_sorted) > 1 else ("?", "?")
-                except Exception as e:
-                    LOGGER.warning(f"Failed to parse column name '{col}': {e}")
-                    #table = unique_id = factor_name = value_col = unique_col = name_col = "?"
-                    table = unique_id = value_col = unique_col = "?"
-
-                rows.append({
-                    "EXPERIMENT": experiment_name,
-                    "CONFIGURATION": configuration,
-                    "TABLE": table,
-                    "COL_UNIQUEID": unique_col,
-                    #"COL_FACTOR": name_col,
-                    "COL_VALUE": value_col,
-                    "UNIQUE IDENTIFIER": unique_id,
-                    #"FACTOR": factor_name,
-                    "VALUES": row[col]
-                })
-
-        df_long = pd.DataFrame(rows)
+        n_runs = len(next(iter(data.values())))
+        df_doe = pd.DataFrame({
+            "EXPERIMENT": np.full(n_runs, experiment_name, dtype=object),
+            "CONFIGURATION": ("configuration_" + pd.Series(np.arange(n_runs)).astype(str).str.zfill(6)).to_numpy(),
+            **data,
+        }, copy=False)
+
+        n_rows, n_cols = len(df_doe), len(factor_cols)
+
+        # transform wide format into long format (configuration-major order)
+        # only the values pass through pandas (label mapping), the repeated id and metadata
+        # columns are expanded from their distinct values with arrow take() kernels
+        argument_only = not any(":" in col for col in factor_cols)
+        if argument_only:
+            # argument-based factor names carry no metadata, the name is both identifier and value column
+            value_col = factor_cols
+            meta = {"UNIQUE IDENTIFIER": factor_cols}
+        else:
+            # parse metadata from each factor column name once (depends on the name only)
+            col_meta = [factor_utils.parse_factor_column(col) for col in factor_cols]
+            table, unique_col, unique_id, value_col = (list(field) for field in zip(*col_meta))
+            meta = {
+                "TABLE": table,
+                "COL_UNIQUEID": unique_col,
+                #"COL_FACTOR": name_col,
+                "COL_VALUE": value_col,
+                "UNIQUE IDENTIFIER": unique_id,
+                #"FACTOR": factor_name,
+            }
+
+        # values are taken row-wise from the wide table before its labels are mapped
+        df_values = pd.DataFrame({
+            "COL_VALUE": np.tile(np.asarray(value_col, dtype=object), n_rows),
+            "VALUES": df_doe[factor_cols].to_numpy().reshape(-1),
+        }, copy=False)
 
         # apply mapping utilities for normalization / variable substitution
         df_doe = factor_utils.doe_string_mapping(df_doe, exec_context.flow_variables, axis=0)
-        df_long = factor_utils.doe_string_mapping(df_long, exec_context.flow_variables, axis=1)
+        df_values = factor_utils.doe_string_mapping(df_values, exec_context.flow_variables, axis=1)
+
+        # ensure consistent string types for KNIME ports (arrow-backed, missing values stay missing)
+        # numeric values only repeat the factor levels, so each distinct level is formatted once;
+        # object values may mix 1 / 1.0 / True which compare equal, so they are cast element-wise
+        values = df_values["VALUES"]
+        if pd.api.types.is_numeric_dtype(values):
+            codes, uniques = pd.factorize(values)
+            labels = pd.array(uniques.astype(str), dtype="string[pyarrow]")
+            values = labels.take(codes, allow_fill=True)
+        else:
+            values = values.astype("string[pyarrow]").array
 
-        # ensure consistent string types for KNIME ports
-        df_long["VALUES"] = df_long["VALUES"].astype(str)
-        if df_long["TABLE"].eq("ARGUMENT").all():
-            df_long = df_long[["EXPERIMENT", "CONFIGURATION", "UNIQUE IDENTIFIER", "VALUES"]]
+        row_idx = pa.array(np.repeat(np.arange(n_rows), n_cols))
+        col_idx = pa.array(np.tile(np.arange(n_cols), n_rows))
+        long_table = pa.table({
+            "EXPERIMENT": pa.repeat(experiment_name, n_rows * n_cols),
+            "CONFIGURATION": pa.array(df_doe["CONFIGURATION"].to_numpy()).take(row_idx),
+            **{name: pa.array(field, type=pa.string()).take(col_idx) for name, field in meta.items()},
+            "VALUES": pa.array(values),
+        })
 
         # return both the wide-format design table and the long-format expanded representation
-        return knext.Table.from_pandas(df_doe), knext.Table.from_pandas(df_long)
\ No newline at end of file
+        return knext.Table.from_pandas(df_doe), knext.Table.from_pyarrow(long_table)
\ No newline at end of file
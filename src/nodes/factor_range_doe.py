@@ -2,8 +2,6 @@ import logging
 import knime.extension as knext
 from sim_ext import main_category
 from utils import parameter_utils as parameters
-import pandas as pd
-import json
 
 # setup logger
 LOGGER = logging.getLogger(__name__)
@@ -185,8 +183,11 @@ class FactorDefinitionDOE:
 
         # handle the case where factor definitions are provided via input table metadata
         if self.factor_input_type == parameters.FactorInputType.TABLEBASED.name:
-            # convert the input KNIME table to a pandas DataFrame
-            input_df = input_1.to_pandas()
+            import pyarrow as pa
+            import pyarrow.compute as pc
+
+            # only the identifier column is consulted, so the input stays in arrow instead of a pandas copy
+            input_table = input_1.to_pyarrow()
 
             # retrieve user-defined metadata to construct factor identifiers
             tab_name = self.table_name
@@ -203,32 +204,33 @@ class FactorDefinitionDOE:
             # retrieve the value list and its range boundaries using utility function
             values, min_val, max_val, step_val = factor_utils.get_values(self, exec_context, value_col)
 
-            # extract all unique (identifier, factor name) pairs to define individual factors
-            # ensure each factor is processed only once → exclude rows with missing identifiers or names → convert to NumPy array for iteration
-            combinations = (
-                input_df[[unique_col]] #, name_col
-                .drop_duplicates()  
-                .dropna()           
-                .values             
-            )
-
-            # generate a unique factor key for each combination and assign a value range to it
-            for unique_val, name_val in combinations:
-                factor_key = (
-                    f"{tab_name}"
-                    f":[{unique_col}]{unique_val}"
-                    #f":[{name_col}]{name_val}"
-                    f":{value_col}"
-                )
-
-                # assign the generated range to the factor key
-                factor_dict[factor_key] = list(range(min_val, max_val + 1, step_val))
-
-            # convert the dictionary to a DataFrame (wide format: one column per factor)
-            df = pd.DataFrame(factor_dict)
+            # extract all unique identifiers to define individual factors
+            # ensure each factor is processed only once → exclude missing identifiers (first-seen order)
+            # arrow's hash-based unique keeps first-seen order, like drop_duplicates on a single column
+            identifiers = pc.unique(pc.drop_null(input_table.column(unique_col))).to_pylist()
+            #combinations = input_df[[unique_col, name_col]].drop_duplicates().dropna().values
+
+            # get_values already returns range(min, max + 1, step) for both data types, it is converted once
+            # into an immutable int64 arrow array that every factor column references (no per-column copy)
+            values = pa.array(values, type=pa.int64())
+
+            # generate a unique factor key for each combination and assign the value range to it
+            factor_keys = [
+                f"{tab_name}"
+                f":[{unique_col}]{unique_val}"
+                #f":[{name_col}]{name_val}"
+                f":{value_col}"
+                for unique_val in identifiers #, name_val in combinations
+            ]
+            factor_dict = dict.fromkeys(factor_keys, values)
+
+            # build the arrow table directly (wide format: one column per factor) and hand it to KNIME
+            return knext.Table.from_pyarrow(pa.table(factor_dict))
 
         # handle the case where the factor is defined manually via node arguments
         elif self.factor_input_type == parameters.FactorInputType.ARGUMENTBASED.name:
+            import pandas as pd
+
             value_col = (
                 self.string_factor_value
                 if self.factor_data_type == parameters.FactorDataType.STRING.name
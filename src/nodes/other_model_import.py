@@ -88,7 +88,7 @@ class OtherModelImporter:
 
     def execute(self, exec_context):
         import os
-        import shutil
+        from utils import resource_utils
         import datetime
 
         selected_path = self.other_model_path
@@ -101,30 +101,33 @@ class OtherModelImporter:
         workspace_folder_dir = os.path.abspath(os.path.join(workflow_data_dir, "..", ".."))
         created_folder_dir = os.path.join(workspace_folder_dir, "Resources", f"OTHER_{now}")
 
-        exec_context.flow_variables.update({
+        # flow variables are collected and published in a single update at the end
+        flow_vars = {
             "simulation_tool": "OTHER",
             "output_mode": self.simulation_output,
             "workflow_folder_dir": workspace_folder_dir,
             "resource_folder": created_folder_dir,
             "cmd_command": self.other_cmd_command,
-        })
+        }
 
         os.makedirs(created_folder_dir, exist_ok=True)
         model_dir = os.path.dirname(selected_path)
         try:
-            shutil.copytree(model_dir, created_folder_dir, dirs_exist_ok=True)
+            resource_utils.copy_model_resources(model_dir, created_folder_dir)
             LOGGER.info(f"Updated resources in {created_folder_dir}")
         except Exception as e:
             LOGGER.warning(f"Could not overwrite some files in {created_folder_dir}: {e}")
 
         model_path_in_res = os.path.join(created_folder_dir, os.path.basename(selected_path))
-        exec_context.flow_variables["model_path"] = model_path_in_res
+        flow_vars["model_path"] = model_path_in_res
 
         if self.simulation_input == pdef.SimulationInputType.FILEBASED.name:
             input_path_in_res = os.path.join(created_folder_dir, self.input_file)
-            exec_context.flow_variables["input_file_path"] = input_path_in_res
+            flow_vars["input_file_path"] = input_path_in_res
 
         if self.simulation_output == pdef.SimulationOutputType.FILEBASED.name:
-            exec_context.flow_variables["output_file_path"] = os.path.join(created_folder_dir, self.output_file)
+            flow_vars["output_file_path"] = os.path.join(created_folder_dir, self.output_file)
+
+        exec_context.flow_variables.update(flow_vars)
 
         return port.SimulationModelPort(port.SimulationModelSpec(), model_path_in_res)
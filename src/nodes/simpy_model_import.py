@@ -1,11 +1,63 @@
 import logging
+import re
+from collections import OrderedDict
 import knime.extension as knext
 from utils import parameter_utils as pdef, port
 from sim_ext import main_category
-import pandas as pd
 
 LOGGER = logging.getLogger(__name__)
 
+# parsed --help defaults of previously imported models, keyed by (source path, mtime, size)
+# so re-executing the importer on an unchanged script skips the interpreter start-up
+# (least recently used entries are evicted, every edit of a script adds a new key)
+_SIMPY_HELP_CACHE: OrderedDict = OrderedDict()
+_SIMPY_HELP_CACHE_SIZE = 32
+
+
+def _cached_help(cache_key: tuple):
+    argument_defaults = _SIMPY_HELP_CACHE.get(cache_key)
+    if argument_defaults is not None:
+        _SIMPY_HELP_CACHE.move_to_end(cache_key)
+    return argument_defaults
+
+
+def _cache_help(cache_key: tuple, argument_defaults: dict):
+    _SIMPY_HELP_CACHE[cache_key] = argument_defaults
+    _SIMPY_HELP_CACHE.move_to_end(cache_key)
+    while len(_SIMPY_HELP_CACHE) > _SIMPY_HELP_CACHE_SIZE:
+        _SIMPY_HELP_CACHE.popitem(last=False)
+
+# matches '--<argument> ... (default: <value>)' in the argparse help text (compiled once at import)
+_SIMPY_ARG_RE = re.compile(r"--([\w\-]+).*?\(default:\s*([^)]+)\)")
+
+# upper bound in seconds for the --help probe (a script that ignores --help would otherwise block the node)
+_SIMPY_HELP_TIMEOUT = 30.0
+
+# plain decimal notations that pd.to_numeric turns into numbers (hex, digit separators and 'nan' stay text)
+_INT_DEFAULT_RE = re.compile(r"[+-]?\d+")
+_FLOAT_DEFAULT_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|[+-]?inf(?:inity)?", re.IGNORECASE)
+
+# converts parsed help defaults (strings) into an arrow column typed the way
+# pd.to_numeric(errors="ignore") typed them: int64 (uint64 above its range) for integers,
+# float64 for decimal and exponent notation, otherwise the strings are kept
+def _default_column(values: list):
+    import math
+    import pyarrow as pa
+
+    stripped = [v.strip() for v in values]
+    if all(_INT_DEFAULT_RE.fullmatch(v) for v in stripped):
+        ints = [int(v) for v in stripped]
+        if all(-2**63 <= i < 2**63 for i in ints):
+            return pa.array(ints, type=pa.int64())
+        if all(0 <= i < 2**64 for i in ints):
+            return pa.array(ints, type=pa.uint64())
+    elif all(not v or _FLOAT_DEFAULT_RE.fullmatch(v) for v in stripped):
+        floats = [float(v) if v else None for v in stripped]
+        # values that overflow to inf without being written as inf stay text
+        if all(f is None or not math.isinf(f) or "inf" in v.lower() for f, v in zip(floats, stripped)):
+            return pa.array(floats, type=pa.float64())
+    return pa.array(values, type=pa.string())
+
 
 @knext.node(
     name="SimPy Model Importer",
@@ -92,12 +144,12 @@ class SimPyModelImporter:
 
     def execute(self, exec_context):
         import os
-        import shutil
-        import re
+        from utils import resource_utils
         import json
         import sys
         import subprocess
         import datetime
+        import pyarrow as pa
 
         selected_path = self.simpy_model_path
         now = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
@@ -109,56 +161,76 @@ class SimPyModelImporter:
         workspace_folder_dir = os.path.abspath(os.path.join(workflow_data_dir, "..", ".."))
         created_folder_dir = os.path.join(workspace_folder_dir, "Resources", f"SIMPY_{now}")
 
-        exec_context.flow_variables.update({
+        # flow variables are collected and published in a single update at the end
+        flow_vars = {
             "simulation_tool": "SIMPY",
             "output_mode": self.simulation_output,
             "workflow_folder_dir": workspace_folder_dir,
             "resource_folder": created_folder_dir,
-        })
-
-        os.makedirs(created_folder_dir, exist_ok=True)
-        model_dir = os.path.dirname(selected_path)
-        try:
-            shutil.copytree(model_dir, created_folder_dir, dirs_exist_ok=True)
-            LOGGER.info(f"Updated resources in {created_folder_dir}")
-        except Exception as e:
-            LOGGER.warning(f"Could not overwrite some files in {created_folder_dir}: {e}")
-
-        model_path_in_res = os.path.join(created_folder_dir, os.path.basename(selected_path))
-        exec_context.flow_variables["model_path"] = model_path_in_res
-
-        if self.simulation_input == pdef.SimulationInputType.FILEBASED.name:
-            input_path_in_res = os.path.join(created_folder_dir, self.input_file)
-            exec_context.flow_variables["input_file_path"] = input_path_in_res
-
-        argument_defaults = {}
-        try:
-            result = subprocess.run(
-                [sys.executable, model_path_in_res, "--help"],
-                capture_output=True, text=True, check=True,
-            )
-            help_output = result.stdout or result.stderr
-            clean_output = " ".join(help_output.splitlines())
-            pattern = r"--([\w\-]+).*?\(default:\s*([^)]+)\)"
-            matches = re.findall(pattern, clean_output)
-            argument_defaults = {k: [v.strip()] for k, v in matches}
-            exec_context.flow_variables["simpy_help_output"] = json.dumps(argument_defaults)
-            if self.simulation_output == pdef.SimulationOutputType.FILEBASED.name:
-                exec_context.flow_variables["output_file_cmd"] = f"--output {self.output_file}"
-                exec_context.flow_variables["output_file_path"] = os.path.join(created_folder_dir, self.output_file)
-        except subprocess.CalledProcessError as e:
-            LOGGER.error(f"SimPy help execution failed: {e.stderr}")
-            raise
-
-        if argument_defaults:
-            df_meta = pd.DataFrame.from_dict(argument_defaults)
-            df_meta = df_meta.apply(pd.to_numeric, errors="ignore")
-            return (
-                port.SimulationModelPort(port.SimulationModelSpec(), model_path_in_res),
-                knext.Table.from_pandas(df_meta),
+        }
+
+        # the help probe only reads the script, so on a cache miss it is started on the source file
+        # and runs while the model folder is copied (the copy is identical to the source)
+        source_stat = os.stat(selected_path)
+        cache_key = (os.path.abspath(selected_path), source_stat.st_mtime_ns, source_stat.st_size)
+        argument_defaults = _cached_help(cache_key)
+        help_probe = None
+        if argument_defaults is None:
+            help_probe = subprocess.Popen(
+                [sys.executable, selected_path, "--help"],
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
             )
 
+        # the probe is always reaped, also when the copy fails or the execution is aborted in between
+        try:
+            os.makedirs(created_folder_dir, exist_ok=True)
+            model_dir = os.path.dirname(selected_path)
+            try:
+                resource_utils.copy_model_resources(model_dir, created_folder_dir)
+                LOGGER.info(f"Updated resources in {created_folder_dir}")
+            except Exception as e:
+                LOGGER.warning(f"Could not overwrite some files in {created_folder_dir}: {e}")
+
+            model_path_in_res = os.path.join(created_folder_dir, os.path.basename(selected_path))
+            flow_vars["model_path"] = model_path_in_res
+
+            if self.simulation_input == pdef.SimulationInputType.FILEBASED.name:
+                input_path_in_res = os.path.join(created_folder_dir, self.input_file)
+                flow_vars["input_file_path"] = input_path_in_res
+
+            if help_probe is not None:
+                try:
+                    stdout, stderr = help_probe.communicate(timeout=_SIMPY_HELP_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    # continue without argument defaults, the timed-out result is not cached
+                    help_probe.kill()
+                    help_probe.communicate()
+                    LOGGER.warning(f"SimPy help execution timed out after {_SIMPY_HELP_TIMEOUT:.0f}s, no argument defaults read")
+                    argument_defaults = {}
+                else:
+                    if help_probe.returncode != 0:
+                        LOGGER.error(f"SimPy help execution failed: {stderr}")
+                        raise subprocess.CalledProcessError(help_probe.returncode, help_probe.args, stdout, stderr)
+                    help_output = stdout or stderr
+                    # wrapped help lines are joined so a default value split across lines is still matched
+                    clean_output = " ".join(help_output.splitlines())
+                    argument_defaults = {k: [v.strip()] for k, v in _SIMPY_ARG_RE.findall(clean_output)}
+                    _cache_help(cache_key, argument_defaults)
+        finally:
+            if help_probe is not None and help_probe.poll() is None:
+                help_probe.kill()
+                help_probe.communicate()
+
+        flow_vars["simpy_help_output"] = json.dumps(argument_defaults)
+        if self.simulation_output == pdef.SimulationOutputType.FILEBASED.name:
+            flow_vars["output_file_cmd"] = f"--output {self.output_file}"
+            flow_vars["output_file_path"] = os.path.join(created_folder_dir, self.output_file)
+
+        exec_context.flow_variables.update(flow_vars)
+
+        # one-row table of argument defaults (empty when the script exposes no defaults)
+        meta_table = pa.table({k: _default_column(v) for k, v in argument_defaults.items()})
         return (
             port.SimulationModelPort(port.SimulationModelSpec(), model_path_in_res),
-            knext.Table.from_pandas(pd.DataFrame()),
+            knext.Table.from_pyarrow(meta_table),
         )
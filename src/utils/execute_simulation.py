@@ -4,46 +4,71 @@ import platform
 import logging
 import sys
 import shutil
+import signal
+import stat
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import lru_cache
 
 # initialize the logger for the module
 logger = logging.getLogger(__name__)
 
 # define supported file extensions for output handling
 allowed_extensions = (".csv", ".txt", ".xlsx", ".xls")
+_allowed_extension_set = frozenset(allowed_extensions)
+
+# configuration columns that name the run and are never passed to a simpy model
+_simpy_skip_columns = frozenset(("EXPERIMENT", "CONFIGURATION"))
+
+# the operating system does not change within a KNIME session, so it is resolved once at import
+os_name = platform.system()
+
+@lru_cache(maxsize=1)
+def _format_date(ordinal):
+    # format the given day once; keeps the former layouts (yyyy-mm-dd on windows, yy-mm-dd elsewhere)
+    fmt = "%Y-%m-%d" if os_name == "Windows" else "%y-%m-%d"
+    return date.fromordinal(ordinal).strftime(fmt)
 
 def _get_current_date_string():
-    # fetch the current system date using subprocess to avoid importing additional packages
-    # uses powershell on windows and the date command on unix-based systems
-    try:
-        if platform.system() == "Windows":
-            cmd = ["powershell", "-command", "get-date -format 'yyyy-MM-dd'"]
-        else:
-            cmd = ["date", "+%y-%m-%d"]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        return result.stdout.strip()
-    except Exception:
-        # fallback string if the system command fails
-        return "unknown_date"
-
-def _get_paths(exec_context, input_2, resource_folder, tool):
+    # fetch the current date natively instead of spawning powershell or the date command
+    # the cache is keyed on the day so a run across midnight still picks up the new date
+    return _format_date(date.today().toordinal())
+
+def _output_extension(name, default=".csv"):
+    # take the suffix once instead of testing every allowed extension in turn
+    ext = os.path.splitext(name)[1].lower()
+    return ext if ext in _allowed_extension_set else default
+
+def _first_row(input_table):
+    # read only the first configuration row as python scalars straight from the arrow table
+    # returns None when no table is connected and an empty dict when the table has no rows
+    if input_table is None:
+        return None
+    rows = input_table.to_pyarrow().slice(0, 1).to_pylist()
+    if not rows:
+        return {}
+    return {col: val for col, val in rows[0].items() if col != "<RowID>"}
+
+def _get_paths(exec_context, row, resource_folder, tool):
     # consolidate path logic and determine the experiment naming convention
-    # extracts experiment and configuration names from knime flow variables or input tables
+    # extracts experiment and configuration names from knime flow variables or the configuration table
+    # (row is the first configuration row as returned by _first_row, or None when no table is connected)
     experiment = exec_context.flow_variables.get("experiment", "default_experiment")
     config_value = "unnamed_config"
 
-    if input_2 is not None:
-        df = input_2.to_pandas()
-        if not df.empty:
-            if "experiment" in [c.lower() for c in df.columns]:
-                # search for the experiment column regardless of casing
-                col_name = [c for c in df.columns if c.lower() == "experiment"][0]
-                val = df.iloc[0][col_name]
-                if isinstance(val, str) and val.strip():
-                    experiment = val
-            
-            # get configuration name for fallback file naming
-            config_value = df.iloc[0].get("CONFIGURATION", "unnamed_config")
+    if row:
+        # search for the experiment column regardless of casing
+        col_name = next((c for c in row if c.lower() == "experiment"), None)
+        if col_name is not None:
+            val = row[col_name]
+            if isinstance(val, str) and val.strip():
+                experiment = val
+
+        # get configuration name for fallback file naming
+        config_value = row.get("CONFIGURATION", "unnamed_config")
 
     # append the current date suffix if the run is identified as a default experiment
     if "default" in experiment.lower():
@@ -51,54 +76,104 @@ def _get_paths(exec_context, input_2, resource_folder, tool):
         experiment = f"{experiment}_{today}"
 
     # define the target directory within a results folder next to resources
-    norm_res = os.path.normpath(resource_folder)
-    parent_dir = os.path.dirname(norm_res)
+    parent_dir = os.path.dirname(os.path.normpath(resource_folder))
     experiment_dir = os.path.join(parent_dir, "results", tool, experiment)
-    
+
     # ensure the results directory exists
     os.makedirs(experiment_dir, exist_ok=True)
     
     return experiment, config_value, experiment_dir
 
+def _start_process(cmd, **kwargs):
+    # start the simulation in its own process group, so a cancel can reach the processes it spawns
+    # (an anylogic script only launches the java model, killing the shell alone would leave it running)
+    if os_name == "Windows":
+        return subprocess.Popen(cmd, creationflags=subprocess.CREATE_NEW_PROCESS_GROUP, **kwargs)
+    return subprocess.Popen(cmd, start_new_session=True, **kwargs)
+
+def _kill_process_tree(process):
+    # stop the started process together with every process it spawned
+    if os_name == "Windows":
+        subprocess.run(
+            ["taskkill", "/T", "/F", "/PID", str(process.pid)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    else:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    # make sure the direct child is gone even if the tree kill did not reach it
+    process.kill()
+    process.wait()
+
+def _wait_for_process(exec_context, process, cmd):
+    # poll the simulation instead of blocking in wait(), so canceling the node also stops the model
+    # polling starts at 5 ms for short runs and backs off linearly to 100 ms for long ones
+    delay = 0.005
+    while process.poll() is None:
+        if exec_context.is_canceled():
+            _kill_process_tree(process)
+            raise RuntimeError("Execution canceled")
+        time.sleep(delay)
+        delay = min(delay + 0.005, 0.1)
+
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, cmd)
+
+def _move_result(source_path, dest_path):
+    # results usually sit on the same drive as the resources, where a single atomic rename is enough
+    # os.replace also overwrites an existing result on windows; shutil.move copies across drives
+    try:
+        os.replace(source_path, dest_path)
+    except OSError:
+        shutil.move(source_path, dest_path)
+
 def run_anylogic(exec_context, input_2, resource_folder):
     # execute anylogic simulation using platform-specific scripts and relocate outputs
-    _, config_value, experiment_dir = _get_paths(exec_context, input_2, resource_folder, "AnyLogic")
-    
-    # check for existence of the source resource folder
-    if not os.path.exists(resource_folder):
-        raise filenotfounderror(f"resource folder not found: {resource_folder}")
 
     # identify the correct execution script based on the operating system
-    os_name = platform.system()
-    script_ext = ".bat" if os_name == "windows" else ".sh"
-    scripts = [f for f in os.listdir(resource_folder) if f.endswith(script_ext)]
-    
-    if not scripts:
-        raise filenotfounderror(f"no {script_ext} file found in {resource_folder}")
+    # scanning the resource folder also validates that it exists (single directory read, no extra stat)
+    script_ext = ".bat" if os_name == "Windows" else ".sh"
+    # the scan stops at the first matching file, directories with a matching name are skipped
+    try:
+        with os.scandir(resource_folder) as entries:
+            script_path = next(
+                (entry.path for entry in entries if entry.name.endswith(script_ext) and entry.is_file()),
+                None,
+            )
+    except FileNotFoundError:
+        raise FileNotFoundError(f"resource folder not found: {resource_folder}")
     
-    script_path = os.path.join(resource_folder, scripts[0])
+    if script_path is None:
+        raise FileNotFoundError(f"no {script_ext} file found in {resource_folder}")
+
+    # resolve the results directory only once the resource folder is known to exist
+    row = _first_row(input_2)
+    _, config_value, experiment_dir = _get_paths(exec_context, row, resource_folder, "AnyLogic")
     
     # prepare the command and set execution permissions for unix systems
-    if os_name == "windows":
+    if os_name == "Windows":
         cmd = ["cmd.exe", "/c", script_path]
     else:
-        os.chmod(script_path, 0o755)
-        cmd = ["/bin/bash", script_path] if os_name == "darwin" else [script_path]
+        # exported scripts usually keep their permissions in the copy, so chmod only when rwxr-xr-x is incomplete
+        # (S_IMODE drops the file type bits, os.chmod only takes permission bits)
+        mode = stat.S_IMODE(os.stat(script_path).st_mode)
+        if mode & 0o755 != 0o755:
+            os.chmod(script_path, mode | 0o755)
+        cmd = ["/bin/bash", script_path] if os_name == "Darwin" else [script_path]
 
     logger.info(f"starting anylogic simulation: {script_path}")
     
     # run simulation using the resource folder as the working directory
-    subprocess.run(cmd, check=True, cwd=resource_folder)
+    _wait_for_process(exec_context, _start_process(cmd, cwd=resource_folder), cmd)
 
     # determine the expected output filename from flow variables or default configuration
     flow_out = os.path.basename(exec_context.flow_variables.get("output_file_path", ""))
     
     # find the appropriate extension by checking against allowed formats
-    target_ext = ".csv"
-    for ext in allowed_extensions:
-        if flow_out.lower().endswith(ext):
-            target_ext = ext
-            break
+    target_ext = _output_extension(flow_out)
 
     # build the source and destination paths for file relocation
     raw_filename = os.path.basename(flow_out) if flow_out else f"{config_value}{target_ext}"
@@ -107,14 +182,23 @@ def run_anylogic(exec_context, input_2, resource_folder):
 
     # move the generated file or attempt to find alternative results in the folder
     if os.path.exists(source_path):
-        shutil.move(source_path, dest_path)
+        _move_result(source_path, dest_path)
         logger.info(f"moved output to: {dest_path}")
     else:
         logger.warning(f"primary output not found, scanning for alternative result files")
-        for f in os.listdir(resource_folder):
-            if f.lower().endswith(allowed_extensions):
-                shutil.move(os.path.join(resource_folder, f), os.path.join(experiment_dir, f))
-                logger.info(f"auto-detected and moved: {f}")
+        # the folder is read again here because the results only exist after the run
+        # (dir entries carry the file type, so folders with a matching name are skipped without a stat)
+        with os.scandir(resource_folder) as entries:
+            results = [entry for entry in entries if entry.name.lower().endswith(allowed_extensions) and entry.is_file()]
+        if len(results) > 4:
+            # the moves are independent, so cross-drive copies of many results overlap in a small pool
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                list(pool.map(lambda entry: _move_result(entry.path, os.path.join(experiment_dir, entry.name)), results))
+        else:
+            for entry in results:
+                _move_result(entry.path, os.path.join(experiment_dir, entry.name))
+        for entry in results:
+            logger.info(f"auto-detected and moved: {entry.name}")
 
     return dest_path
 
@@ -131,41 +215,46 @@ def run_other(exec_context, model_path, resource_folder):
     cmd_command = cmd_command.replace("{model_path}", model_path)
 
     logger.info(f"Executing CMD command: {cmd_command}")
-    try:
-        proc = subprocess.run(cmd_command, cwd=resource_folder, capture_output=True, text=True, shell=True, check=True)
-        if proc.stdout:
-            logger.info(f"CMD output: {proc.stdout}")
-    except subprocess.CalledProcessError as e:
-        logger.error(f"CMD execution failed: {e.stderr}")
-        raise
+    proc = subprocess.Popen(
+        cmd_command, cwd=resource_folder, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        text=True, shell=True, bufsize=1,
+    )
+
+    # stdout is logged while the tool runs instead of being buffered until it exits,
+    # stderr is drained on a helper thread (keeping only its tail for the error message) so neither pipe can fill up
+    stderr_tail = deque(maxlen=200)
+    stderr_reader = threading.Thread(target=stderr_tail.extend, args=(proc.stderr,), daemon=True)
+    stderr_reader.start()
+    for line in proc.stdout:
+        logger.info(f"CMD output: {line.rstrip()}")
+    returncode = proc.wait()
+    stderr_reader.join()
+
+    if returncode != 0:
+        stderr = "".join(stderr_tail)
+        logger.error(f"CMD execution failed: {stderr}")
+        raise subprocess.CalledProcessError(returncode, cmd_command, stderr=stderr)
 
 def run_simpy(exec_context, input_2, model_path, resource_folder):
     # run simpy simulation and map input table columns to command line arguments
-    _, config_value, experiment_dir = _get_paths(exec_context, input_2, resource_folder, "SimPy")
+    # only the first configuration row is read and shared with the path resolution
+    row = _first_row(input_2)
+    _, config_value, experiment_dir = _get_paths(exec_context, row, resource_folder, "SimPy")
     simpy_args = []
     val = ''
 
-    if input_2 is not None:
-        df = input_2.to_pandas()
-        if df.empty:
-            raise valueerror("input table is empty")
+    if row is not None:
+        if not row:
+            raise ValueError("input table is empty")
 
-        row = df.iloc[0]
-        
         # determine the preferred file extension for the output
         flow_out = exec_context.flow_variables.get("output_file_cmd", "")
-        fallback_ext = ".csv"
-        for ext in allowed_extensions:
-            if flow_out.lower().endswith(ext):
-                fallback_ext = ext
-                break
+        fallback_ext = _output_extension(flow_out)
 
         output_set = False
-        # iterate through columns to build command line flags
-        for col in df.columns:
-            if col.upper() in {"EXPERIMENT", "CONFIGURATION"}:
-                continue
-            
+        # iterate through columns to build command line flags (naming columns are filtered upfront)
+        arg_cols = [col for col in row if col.upper() not in _simpy_skip_columns]
+        for col in arg_cols:
             val = row[col]
             # redirect output path to the specific experiment directory
             if col.lower() == "output":
@@ -199,6 +288,6 @@ def run_simpy(exec_context, input_2, model_path, resource_folder):
     # assemble the final command using the current python interpreter
     cmd = [sys.executable, model_path] + simpy_args
     logger.info(f"running simpy model: {' '.join(cmd)}")
-    subprocess.run(cmd, check=True)
+    _wait_for_process(exec_context, _start_process(cmd), cmd)
 
     return simpy_args[1]
\ No newline at end of file
@@ -2,6 +2,8 @@ import logging
 import knime_extension as knext
 from utils import parameter_utils as parameters
 import json
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 
 # setup logger
@@ -63,6 +65,117 @@ def get_values(node, exec_context, column_name):
         # for numeric types, return the value range based on user-defined min, max, and step
         return list(range(node.min_value, node.max_value + 1, node.step_value)), node.min_value, node.max_value, node.step_value
 
+# parses the metadata encoded in a factor column name created by the Factor Definition node
+def parse_factor_column(col: str) -> tuple:
+    """
+        extracts the table, identifier and value column metadata from a factor column name
+
+        table-based factor columns follow the pattern '<table>:[<id column>]<id value>:<value column>'
+        (e.g., 'machines:[NAME]Drill:capacity'), while argument-based factors use the plain
+        argument name without any ':' separator
+
+        parameters:
+            col (str): the factor column name
+
+        returns:
+            tuple: (table, unique_col, unique_id, value_col)
+                - argument-based columns → ('ARGUMENT', col, col, col)
+                - unparsable columns → ('?', '?', '?', '?')
+    """
+
+    try:
+        parts = col.split(":")
+        is_argument_based = len(parts) == 1
+        if is_argument_based:
+            #return "ARGUMENT", col, col, col, col, col
+            return "ARGUMENT", col, col, col
+
+        table = parts[0] if parts else "?"
+        label_map = {}
+        value_col = "?"
+        for part in parts[1:]:
+            # single scan for '[label]value', parts without a closing bracket are value columns
+            label, sep, value = part[1:].partition("]") if part[:1] == "[" else ("", "", "")
+            if sep:
+                label_map[label.upper()] = value
+            else:
+                value_col = part
+        # only the alphabetically first label is used, so take the minimum instead of sorting
+        unique_col, unique_id = min(label_map.items(), default=("?", "?"))
+        #name_col, factor_name = sorted(label_map.items())[1] if len(label_map) > 1 else ("?", "?")
+        return table, unique_col, unique_id, value_col
+    except Exception as e:
+        LOGGER.warning(f"Failed to parse column name '{col}': {e}")
+        return "?", "?", "?", "?"
+
+# parses the JSON of a 'factor-mapping_' flow variable into an integer-keyed dict, the raw string is
+# the cache key so an unchanged mapping is parsed once for both DoE outputs and across executions
+# (the dict is shared, read-only)
+@lru_cache(maxsize=512)
+def _parse_mapping(raw: str) -> dict:
+    mapping = {}
+    for code, label in json.loads(raw).items():
+        # codes are matched as str(int(v)), so only canonical integer strings can ever match
+        try:
+            if str(int(code)) == code:
+                mapping[int(code)] = label
+        except ValueError:
+            continue
+    return mapping
+
+# maps numeric-coded factor values back to their string labels in one vectorized pass
+def _map_coded_values(values: pd.Series, mapping: dict) -> pd.Series:
+    """
+        replaces numeric codes in a Series by their labels from a factor mapping
+
+        each value is rounded to the nearest code (half to even, like str(int(round(float(v)))))
+        and looked up in the mapping; missing, non-numeric and unmapped values are kept as they are
+
+        parameters:
+            values (pd.Series): the coded factor values
+            mapping (dict): integer code → label, parsed from the 'factor-mapping_' flow variables
+
+        returns:
+            pd.Series: the mapped values (the input itself when no value has a label)
+    """
+
+    codes = pd.to_numeric(values, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    # codes beyond the int64 range cannot be mapped (and must not wrap around when cast)
+    valid = np.isfinite(codes) & (np.abs(codes) < 2.0 ** 62)
+    if not mapping or not valid.any():
+        return values
+
+    # round only the numeric codes, no per-value string keys are built
+    idx = np.rint(codes[valid]).astype(np.int64)
+    lut_size = max(mapping) + 1
+    if min(mapping) >= 0 and lut_size == len(mapping):
+        # dense codes 0..K-1 (as produced by factor_string_mapping): branch-free gather from a lookup array
+        lut = np.empty(lut_size, dtype=object)
+        lut[list(mapping)] = list(mapping.values())
+        hit = (idx >= 0) & (idx < lut_size)
+        labels = lut[idx[hit]]
+    else:
+        hit = np.isin(idx, list(mapping))
+        labels = pd.Series(idx[hit]).map(mapping).to_numpy()
+    if not hit.any():
+        return values
+
+    mapped = values.to_numpy(dtype=object, copy=True)
+    mapped[np.flatnonzero(valid)[hit]] = labels
+    # let pandas infer the resulting dtype like Series.apply does
+    return pd.Series(mapped, index=values.index, name=values.name).infer_objects()
+
+# checks whether a wide-format column already holds the labels of its mapping (e.g. mapped in an earlier pass)
+def _holds_labels(values: pd.Series, mapping: dict) -> bool:
+    # infer_dtype stops at the first non-string value, so coded columns are rejected right away
+    if values.dtype != object or pd.api.types.infer_dtype(values, skipna=True) != "string":
+        return False
+    labels = pd.Series(list(mapping.values()), dtype=object)
+    # only safe when no label could itself be read as a numeric code
+    if pd.to_numeric(labels, errors="coerce").notna().any():
+        return False
+    return bool(values.dropna().isin(labels).all())
+
 def doe_string_mapping(df: pd.DataFrame, flow_vars: dict, axis: int = 0) -> pd.DataFrame:
     """
         applies string label mappings to a DoE (Design of Experiments) DataFrame using flow variables
@@ -94,8 +207,8 @@ def doe_string_mapping(df: pd.DataFrame, flow_vars: dict, axis: int = 0) -> pd.D
         if key.startswith("factor-mapping_"):
             col = key.replace("factor-mapping_", "")
             try:
-                # parse the JSON string into a Python dict
-                mappings[col] = json.loads(val)
+                # parse the JSON string into a Python dict (cached per raw string)
+                mappings[col] = _parse_mapping(val)
             except Exception as e:
                 LOGGER.warning(f"Mapping from flow variable '{key}' could not be loaded: {e}")
 
@@ -109,28 +222,23 @@ def doe_string_mapping(df: pd.DataFrame, flow_vars: dict, axis: int = 0) -> pd.D
             value_col = col.split(":")[-1]  
             mapping = mappings.get(value_col)
 
-            if mapping:
-                # apply mapping to each cell: convert to float → round → int → str → mapped label
-                df[col] = df[col].apply(
-                    lambda v: mapping.get(str(int(round(float(v)))), v) if pd.notna(v) else v
-                )
+            if mapping and not _holds_labels(df[col], mapping):
+                # apply mapping to the whole column: convert to float → round → int → str → mapped label
+                df[col] = _map_coded_values(df[col], mapping)
 
     elif axis == 1:
         # apply mappings to long-format table (values are in a single column per row)
-        def replace_value(row):
-            col_key = row.get("COL_VALUE")
-            mapping = mappings.get(col_key)
-
-            if mapping:
-                try:
-                    # same conversion logic as above but applied per row
-                    v_rounded = str(int(round(float(row["VALUES"]))))
-                    return mapping.get(v_rounded, row["VALUES"])
-                except:
-                    return row["VALUES"]
-            return row["VALUES"]
-
-        # apply the mapping row-wise
-        df["VALUES"] = df.apply(replace_value, axis=1)
+        # each mapped value column is handled as one group of rows with the same vectorized lookup
+        mapped = df["VALUES"].to_numpy(dtype=object, copy=True)
+        col_keys = df["COL_VALUE"]
+        for col_key, mapping in mappings.items():
+            if not mapping:
+                continue
+            rows = (col_keys == col_key).to_numpy()
+            if rows.any():
+                mapped[rows] = _map_coded_values(pd.Series(mapped[rows]), mapping).to_numpy(dtype=object)
+
+        # let pandas infer the resulting dtype like the former row-wise apply did
+        df["VALUES"] = pd.Series(mapped, index=df.index).infer_objects()
 
     return df
\ No newline at end of file
@@ -0,0 +1,55 @@
+import os
+import shutil
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+# initialize the logger for the module
+logger = logging.getLogger(__name__)
+
+def copy_model_resources(model_dir, resource_folder):
+    """
+        copies the folder of a simulation model into its resource folder
+
+        the directory tree is walked once (following directory links like shutil.copytree), while
+        the individual file copies are handed to a thread pool so the syscall latency of many small
+        files (jars, images, database snapshots) overlaps instead of being paid one file at a time
+
+        directory metadata is only copied after every file has been written, so read-only source
+        folders do not lock their copies before the files arrive
+
+        parameters:
+            model_dir (str): the folder containing the selected model file
+            resource_folder (str): the target resource folder (existing files are overwritten)
+
+        raises:
+            the first error raised by a file copy, after all pending copies have finished
+            shutil.Error listing the folders that could not be read (like shutil.copytree), once
+            all readable files have been copied
+    """
+
+    # file copies are I/O-bound, so more workers than cores help to overlap the waiting
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    copied_dirs = []
+    # folders the walk cannot list are collected and reported once the readable files are copied
+    unreadable = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = []
+        for src_dir, _, files in os.walk(model_dir, onerror=unreadable.append, followlinks=True):
+            dst_dir = os.path.join(resource_folder, os.path.relpath(src_dir, model_dir))
+            os.makedirs(dst_dir, exist_ok=True)
+            copied_dirs.append((src_dir, dst_dir))
+            for name in files:
+                pending.append(pool.submit(shutil.copy2, os.path.join(src_dir, name), os.path.join(dst_dir, name)))
+        # surface copy errors to the caller (the pool drains all pending copies on exit)
+        for copy in pending:
+            copy.result()
+
+    # apply directory metadata deepest first, once nothing is written into the folders anymore
+    for src_dir, dst_dir in reversed(copied_dirs):
+        shutil.copystat(src_dir, dst_dir)
+
+    if unreadable:
+        raise shutil.Error([(err.filename, os.path.join(resource_folder, os.path.relpath(err.filename, model_dir)), str(err))
+                            for err in unreadable])
+
+    logger.info(f"copied {len(pending)} files from {model_dir}")
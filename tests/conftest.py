@@ -0,0 +1,5 @@
+import os
+import sys
+
+# the extension modules are imported the way KNIME loads them, with src/ on the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
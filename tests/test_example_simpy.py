@@ -0,0 +1,56 @@
+import importlib.util
+import itertools
+import os
+from collections import deque
+
+import pytest
+
+pytest.importorskip("simpy")
+
+MODEL_PATH = os.path.join(os.path.dirname(__file__), "..", "demo", "example models", "simpy", "example_simpy.py")
+
+
+@pytest.fixture(scope="module")
+def model():
+    spec = importlib.util.spec_from_file_location("example_simpy", MODEL_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _run(engine, output_file, *args):
+    # returns the raised error (if any) and the written log (None when no file was written)
+    try:
+        engine(*args, str(output_file))
+        error = None
+    except ValueError as e:
+        error = str(e)
+    log = output_file.read_bytes() if output_file.exists() else None
+    return error, log
+
+
+# customers, interarrival, service time, capacity, duration (including invalid values)
+CASES = list(itertools.product([0, 1, 3, 6], [2.0, -1.0], [0, 0.5, 2.5, -1], [0, 1, 2], [0, 2.5, 7, -1]))
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_fast_engine_matches_simpy(model, tmp_path, case):
+    def simpy_engine(*args):
+        deque(model.run_simulation(*args), maxlen=0)
+
+    expected = _run(simpy_engine, tmp_path / "simpy.csv", *case)
+    assert _run(model.run_simulation_fast, tmp_path / "fast.csv", *case) == expected
+
+
+@pytest.mark.parametrize("engine_name", ["run_simulation", "run_simulation_fast"])
+def test_failed_run_keeps_previous_result(model, tmp_path, engine_name):
+    output_file = tmp_path / "result.csv"
+    output_file.write_bytes(b"previous")
+
+    engine = getattr(model, engine_name)
+    with pytest.raises(ValueError, match="Negative delay"):
+        # negative interarrival time: fails after the output has been opened
+        deque(engine(3, -1.0, 1.0, 1, 10.0, str(output_file)) or (), maxlen=0)
+
+    assert output_file.read_bytes() == b"previous"
+    assert list(tmp_path.iterdir()) == [output_file]
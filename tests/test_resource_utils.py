@@ -0,0 +1,60 @@
+import os
+import shutil
+
+import pytest
+
+from utils import resource_utils
+
+
+def _files(root):
+    return sorted(
+        os.path.relpath(os.path.join(path, name), root)
+        for path, _, names in os.walk(root)
+        for name in names
+    )
+
+
+def test_copies_nested_folders(tmp_path):
+    model_dir = tmp_path / "model"
+    (model_dir / "lib" / "jars").mkdir(parents=True)
+    (model_dir / "model.py").write_text("print('ok')")
+    (model_dir / "lib" / "jars" / "a.jar").write_bytes(b"jar")
+
+    target = tmp_path / "resources"
+    resource_utils.copy_model_resources(str(model_dir), str(target))
+
+    assert _files(target) == _files(model_dir)
+
+
+def test_read_only_folder_keeps_its_files(tmp_path):
+    model_dir = tmp_path / "model"
+    (model_dir / "a").mkdir(parents=True)
+    (model_dir / "a" / "y.txt").write_text("y")
+    os.chmod(model_dir / "a", 0o555)
+
+    target = tmp_path / "resources"
+    try:
+        resource_utils.copy_model_resources(str(model_dir), str(target))
+        assert _files(target) == ["a/y.txt"]
+    finally:
+        os.chmod(model_dir / "a", 0o755)
+        os.chmod(target / "a", 0o755)
+
+
+@pytest.mark.skipif(os.name == "nt" or os.geteuid() == 0, reason="needs POSIX permissions of a non-root user")
+def test_unreadable_folder_raises(tmp_path):
+    model_dir = tmp_path / "model"
+    (model_dir / "locked").mkdir(parents=True)
+    (model_dir / "ok").write_text("ok")
+    os.chmod(model_dir / "locked", 0)
+
+    target = tmp_path / "resources"
+    try:
+        with pytest.raises(shutil.Error) as excinfo:
+            resource_utils.copy_model_resources(str(model_dir), str(target))
+    finally:
+        os.chmod(model_dir / "locked", 0o755)
+
+    # the readable files are still copied before the error is raised, like shutil.copytree does
+    assert _files(target) == ["ok"]
+    assert excinfo.value.args[0][0][0] == str(model_dir / "locked")
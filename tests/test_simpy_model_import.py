@@ -0,0 +1,34 @@
+import warnings
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("knime.extension")
+
+from nodes.simpy_model_import import _default_column
+
+
+# help defaults as parsed from '(default: ...)', including notations pd.to_numeric does not read
+DEFAULTS = [
+    "5", "-5", "+4", "007", "-0", "2.0", "-2.5", ".5", "5.", "+.5", "1e3", "1E-2",
+    "inf", "-Infinity", "nan", "0x10", "1_000", "1,5", "1e400", "1.5e", "True", "simpy_output.csv",
+    "12345678901234567890", "18446744073709551616", "-12345678901234567890",
+]
+
+
+@pytest.mark.parametrize("value", DEFAULTS)
+def test_default_column_matches_to_numeric(value):
+    with warnings.catch_warnings():
+        # errors="ignore" is what the importer originally typed the defaults with
+        warnings.simplefilter("ignore", FutureWarning)
+        expected = pd.to_numeric(pd.Series([value]), errors="ignore")
+
+    column = _default_column([value]).to_pandas()
+    assert column.dtype == expected.dtype
+    assert column.tolist() == expected.tolist()
+
+
+def test_default_column_keeps_hex_and_long_integers_as_text():
+    assert _default_column(["0x10"]).to_pylist() == ["0x10"]
+    assert _default_column(["123456789012345678901"]).to_pylist() == ["123456789012345678901"]
+    assert _default_column(["+4"]).to_pylist() == [4]